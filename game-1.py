@@ -4,27 +4,47 @@ import json
 import os
 import math
 import sys
+import hashlib
+import inspect
+import numpy as np
 
-# Try to import numpy for sound generation
+# Initialize Pygame and mixer
+pygame.init()
 try:
-    import numpy as np
+    # A larger buffer (~93 ms) avoids audio dropouts under CPU load
+    pygame.mixer.init(frequency=22050, size=-16, channels=2, buffer=2048)
     SOUND_ENABLED = True
-except ImportError:
+except pygame.error:
     SOUND_ENABLED = False
-    print("NumPy not found. Sound will be disabled. Install with: pip install numpy")
-
-# Initialize Pygame and mixer
-pygame.init()
-pygame.mixer.init(frequency=22050, size=-16, channels=2, buffer=512)
+    print("No audio device available. Sound will be disabled.")
 
 # Constants
 SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 600
 FPS = 60
+# Lives at the start of each game
+MAX_LIVES = 3
+# 0 leaves the frame rate to clock.tick(FPS) instead of blocking on the
+# display refresh; 1 requests vsync. pygame only honours it for SCALED
+# displays, so it affects the portrait mode alone
+VSYNC = 0
 
 # Border thickness for keeping graphics away from the edges
 BORDER_WIDTH = 20
 
+# Background star field: one packed record per star
+STAR_COUNT = 100
+STAR_DTYPE = np.dtype([('x', 'f4'), ('y', 'f4'), ('size', 'i4'), ('speed', 'f4')])
+
+# pygame-ce provides Surface.fblits, a faster blits without per-blit rects
+HAS_FBLITS = hasattr(pygame.Surface, "fblits")
+
+# Maximum number of rendered text surfaces kept between frames
+TEXT_CACHE_SIZE = 256
+
+# Directory for synthesized sounds saved between launches
+SOUND_CACHE_DIR = "cache"
+
 # Colors
 WHITE = (255, 255, 255)
 BLACK = (0, 0, 0)
@@ -42,36 +62,78 @@ class SoundEffects:
     def __init__(self):
         self.sample_rate = 22050
         self.music_position = 0
+        self.rng = np.random.default_rng()
+        # Reusable stereo output buffer, large enough for the 8 second music loop
+        self._scratch = np.empty((self.sample_rate * 8, 2), dtype=np.int16)
+        
+        # Cached sounds are keyed on the synthesis code and mixer format so
+        # that editing a generator or the mixer settings invalidates them
+        try:
+            source = inspect.getsource(SoundEffects)
+        except (OSError, TypeError):
+            self.cache_key = None
+        else:
+            key_data = f"{source}{pygame.mixer.get_init()}".encode()
+            self.cache_key = hashlib.sha1(key_data).hexdigest()[:12]
+        
+    def load_cached(self, name, generator):
+        """Return a sound from the disk cache, generating and saving it on a miss."""
+        if self.cache_key is None:
+            return generator()
+        
+        path = os.path.join(SOUND_CACHE_DIR, f"{name}_{self.cache_key}.npy")
+        try:
+            return pygame.sndarray.make_sound(np.load(path))
+        except (OSError, ValueError, EOFError):
+            pass
+        
+        sound = generator()
+        try:
+            os.makedirs(SOUND_CACHE_DIR, exist_ok=True)
+            np.save(path, pygame.sndarray.array(sound))
+        except OSError:
+            pass
+        return sound
+        
+    def stereo_buffer(self, frames):
+        """Return a (frames, 2) int16 view of the reusable output buffer."""
+        if frames > len(self._scratch):
+            self._scratch = np.empty((frames, 2), dtype=np.int16)
+        return self._scratch[:frames]
+        
+    def make_stereo_sound(self, left, right=None):
+        """Build a Sound from mono sample arrays, using left for both channels if right is omitted."""
+        if right is None:
+            right = left
+        arr = self.stereo_buffer(len(left))
+        arr[:, 0] = left
+        arr[:, 1] = right
+        # make_sound copies the samples, so the buffer is free for the next sound
+        return pygame.sndarray.make_sound(arr)
         
     def generate_tone(self, frequency, duration, volume=0.5):
         frames = int(duration * self.sample_rate)
-        arr = np.zeros((frames, 2), dtype=np.int16)
-        for i in range(frames):
-            sample = int(volume * 32767 * np.sin(2 * np.pi * frequency * i / self.sample_rate))
-            arr[i] = [sample, sample]
-        return pygame.sndarray.make_sound(arr)
+        t = np.arange(frames, dtype=np.float32)
+        wave = (volume * 32767 * np.sin(2 * np.pi * frequency * t / self.sample_rate)).astype(np.int16)
+        return self.make_stereo_sound(wave)
     
     def generate_spray_sound(self):
         # Whoosh sound - white noise with envelope
         duration = 0.15
         frames = int(duration * self.sample_rate)
-        arr = np.zeros((frames, 2), dtype=np.int16)
-        
-        for i in range(frames):
-            # White noise
-            noise = np.random.randint(-16383, 16383)
-            # Envelope (fade in and out)
-            envelope = np.sin(np.pi * i / frames)
-            sample = int(noise * envelope * 0.3)
-            arr[i] = [sample, sample]
+        
+        # White noise
+        noise = self.rng.integers(-16383, 16383, frames, dtype=np.int32)
+        # Envelope (fade in and out)
+        envelope = np.sin(np.pi * np.arange(frames, dtype=np.float32) / frames)
+        sample = (noise * envelope * 0.3).astype(np.int16)
             
-        return pygame.sndarray.make_sound(arr)
+        return self.make_stereo_sound(sample)
     
     def generate_background_music(self):
         # Create an original atmospheric electronic track
         duration = 8.0  # 8 second loop
         frames = int(duration * self.sample_rate)
-        arr = np.zeros((frames, 2), dtype=np.int16)
         
         # Time array
         t = np.linspace(0, duration, frames)
@@ -79,12 +141,9 @@ class SoundEffects:
         # Bass line - deep, pulsing bass
         bass_freq = 55  # Low A
         bass_pattern = np.array([1, 0, 0, 1, 0, 0, 1, 0])
-        bass_envelope = np.zeros(frames)
-        
-        for i in range(len(t)):
-            beat_pos = int((i / self.sample_rate) * 2) % len(bass_pattern)
-            if bass_pattern[beat_pos]:
-                bass_envelope[i] = np.exp(-(i % (self.sample_rate // 2)) / (self.sample_rate / 10))
+        i = np.arange(frames)
+        beat_pos = (i * 2 // self.sample_rate) % len(bass_pattern)
+        bass_envelope = bass_pattern[beat_pos] * np.exp(-(i % (self.sample_rate // 2)) / (self.sample_rate / 10))
         
         bass = np.sin(2 * np.pi * bass_freq * t) * bass_envelope * 8000
         
@@ -103,24 +162,39 @@ class SoundEffects:
             end = (i + 1) * chord_duration
             if end > frames:
                 end = frames
+            length = end - start
             
+            # Build the whole chord in the frequency domain and synthesize it
+            # with a single inverse FFT
+            spectrum = np.zeros(length // 2 + 1, dtype=complex)
             for freq in chord:
-                pad[start:end] += np.sin(2 * np.pi * freq * t[start:end]) * 1000
-                # Add subtle vibrato
-                vibrato = np.sin(2 * np.pi * 5 * t[start:end]) * 2
-                pad[start:end] += np.sin(2 * np.pi * (freq + vibrato) * t[start:end]) * 500
+                # Plain tone plus a 2 Hz vibrato at 5 Hz, expressed as the carrier
+                # and first sideband pair of an FM signal (J0(0.4), J1(0.4))
+                partials = [
+                    (freq, 1000 + 500 * 0.9604),
+                    (freq + 5, 500 * 0.1960),
+                    (freq - 5, -500 * 0.1960)
+                ]
+                for partial_freq, amplitude in partials:
+                    k = int(round(partial_freq * length / self.sample_rate))
+                    # Sine of the given amplitude, phase-aligned with the segment start
+                    spectrum[k] += -0.5j * amplitude * length * np.exp(2j * np.pi * k * start / length)
+            
+            pad[start:end] = np.fft.irfft(spectrum, n=length)
         
-        # Hi-hat pattern
+        # Hi-hat pattern - one decaying noise burst at the start of each active eighth beat
         hihat = np.zeros(frames)
-        hihat_pattern = [1, 0, 1, 0, 1, 0, 1, 1]
-        
-        for i in range(len(t)):
-            beat_pos = int((i / self.sample_rate) * 8) % len(hihat_pattern)
-            if hihat_pattern[beat_pos]:
-                # White noise burst for hi-hat
-                burst_length = min(1000, frames - i)
-                if burst_length > 0:
-                    hihat[i:i+burst_length] = np.random.normal(0, 1000, burst_length) * np.exp(-np.linspace(0, 5, burst_length))
+        hihat_pattern = np.array([1, 0, 1, 0, 1, 0, 1, 1])
+        burst_length = 1000
+        
+        beats = np.arange(int(duration * 8))
+        beats = beats[hihat_pattern[beats % len(hihat_pattern)] == 1]
+        onsets = -(-beats * self.sample_rate // 8)  # first sample of each beat
+        burst_idx = onsets[:, None] + np.arange(burst_length)
+        # White noise burst for hi-hat
+        bursts = self.rng.normal(0, 1000, burst_idx.shape) * np.exp(-np.linspace(0, 5, burst_length))
+        in_range = burst_idx < frames
+        np.add.at(hihat, burst_idx[in_range], bursts[in_range])
         
         # Synth lead - subtle melodic element
         lead = np.zeros(frames)
@@ -175,49 +249,46 @@ class SoundEffects:
         # Stereo effect - slight delay on right channel
         delay_samples = int(0.01 * self.sample_rate)
         left_channel = mixed
-        right_channel = np.roll(mixed, delay_samples)
+        right_channel = np.empty_like(mixed)
+        right_channel[delay_samples:] = mixed[:-delay_samples]
+        right_channel[:delay_samples] = 0
         
-        # Convert to stereo
-        arr[:, 0] = left_channel.astype(np.int16)
-        arr[:, 1] = right_channel.astype(np.int16)
-        
-        return pygame.sndarray.make_sound(arr)
+        return self.make_stereo_sound(left_channel, right_channel)
     
     def generate_explosion_sound(self):
         # Explosion - low frequency noise burst
         duration = 0.3
         frames = int(duration * self.sample_rate)
-        arr = np.zeros((frames, 2), dtype=np.int16)
-        
-        for i in range(frames):
-            # Low frequency noise
-            noise = np.random.randint(-32767, 32767)
-            # Decay envelope
-            envelope = (1 - i / frames) ** 2
-            # Add some low frequency modulation
-            mod = np.sin(2 * np.pi * 50 * i / self.sample_rate)
-            sample = int(noise * envelope * 0.4 * (0.5 + 0.5 * mod))
-            arr[i] = [sample, sample]
+        i = np.arange(frames, dtype=np.float32)
+        
+        # Low frequency noise
+        noise = self.rng.integers(-32767, 32767, frames, dtype=np.int32)
+        # Decay envelope
+        envelope = (1 - i / frames) ** 2
+        # Add some low frequency modulation
+        mod = np.sin(2 * np.pi * 50 * i / self.sample_rate)
+        sample = (noise * envelope * 0.4 * (0.5 + 0.5 * mod)).astype(np.int16)
             
-        return pygame.sndarray.make_sound(arr)
+        return self.make_stereo_sound(sample)
     
     def generate_bad_odor_sound(self):
         # Grumbling sound - low frequency with wobble
         duration = 0.5
         frames = int(duration * self.sample_rate)
-        arr = np.zeros((frames, 2), dtype=np.int16)
+        i = np.arange(frames)
         
         base_freq = 80
-        for i in range(frames):
-            # Wobbling frequency
-            wobble = np.sin(2 * np.pi * 5 * i / self.sample_rate) * 20
-            freq = base_freq + wobble
-            sample = int(16383 * np.sin(2 * np.pi * freq * i / self.sample_rate))
-            # Add some noise
-            noise = np.random.randint(-2000, 2000)
-            arr[i] = [sample + noise, sample + noise]
+        # Wobbling frequency
+        wobble = np.sin(2 * np.pi * 5 * i / self.sample_rate) * 20
+        freq = base_freq + wobble
+        # Integrate the frequency to get a continuous phase
+        phase = 2 * np.pi * np.cumsum(freq) / self.sample_rate
+        sample = (16383 * np.sin(phase)).astype(np.int32)
+        # Add some noise
+        noise = self.rng.integers(-2000, 2000, frames, dtype=np.int32)
+        out = (sample + noise).astype(np.int16)
             
-        return pygame.sndarray.make_sound(arr)
+        return self.make_stereo_sound(out)
     
     def generate_level_complete_sound(self):
         # Victory fanfare - ascending tones
@@ -234,17 +305,16 @@ class SoundEffects:
         # Descending tones
         duration = 0.8
         frames = int(duration * self.sample_rate)
-        arr = np.zeros((frames, 2), dtype=np.int16)
-        
-        for i in range(frames):
-            # Descending frequency
-            freq = 400 * (1 - i / frames * 0.5)
-            sample = int(16383 * np.sin(2 * np.pi * freq * i / self.sample_rate))
-            # Decay
-            envelope = (1 - i / frames)
-            arr[i] = [int(sample * envelope), int(sample * envelope)]
+        i = np.arange(frames, dtype=np.float32)
+        
+        # Descending frequency
+        freq = 400 * (1 - i / frames * 0.5)
+        phase = 2 * np.pi * np.cumsum(freq) / self.sample_rate
+        # Decay
+        envelope = (1 - i / frames)
+        out = (16383 * np.sin(phase) * envelope).astype(np.int16)
             
-        return pygame.sndarray.make_sound(arr)
+        return self.make_stereo_sound(out)
 
 class Player(pygame.sprite.Sprite):
     def __init__(self, spray_image_path=None, joystick=None, joystick_center=0.0, button_map=None):
@@ -253,7 +323,7 @@ class Player(pygame.sprite.Sprite):
         # Try to load the spray image
         if spray_image_path and os.path.exists(spray_image_path):
             try:
-                original_image = pygame.image.load(spray_image_path)
+                original_image = pygame.image.load(spray_image_path).convert_alpha()
                 orig_w, orig_h = original_image.get_size()
                 self.width = 120
                 self.height = int(orig_h * (self.width / orig_w))
@@ -279,11 +349,16 @@ class Player(pygame.sprite.Sprite):
         self.image = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
         
         # Enhanced deodorant drawing - scaled for wider bottle
-        # Can body with gradient effect
-        for i in range(80):
-            color_value = 128 + i * 1.5
-            pygame.draw.rect(self.image, (color_value, color_value, color_value), 
-                           (20 + i//8, 25, 80 - i//4, 55))
+        # Can body with gradient effect - 80 nested bands that get lighter and
+        # narrower; each column shows the last band covering it
+        columns = np.arange(20, 100)
+        band = np.arange(80)[:, None]
+        covered = (columns >= 20 + band // 8) & (columns < 100 + band // 8 - band // 4)
+        last_band = 79 - np.argmax(covered[::-1], axis=0)
+        shade = (128 + last_band * 1.5).astype(np.uint8)
+        gradient = pygame.Surface((80, 55))
+        pygame.surfarray.blit_array(gradient, np.broadcast_to(shade[:, None, None], (80, 55, 3)))
+        self.image.blit(gradient, (20, 25))
         
         # Dove blue section - wider
         pygame.draw.rect(self.image, DOVE_BLUE, (25, 30, 70, 45))
@@ -309,6 +384,9 @@ class Player(pygame.sprite.Sprite):
         men_rect = men_text.get_rect(center=(60, 58))
         self.image.blit(men_text, men_rect)
         
+        # Match the display format so blits skip per-pixel conversion
+        self.image = self.image.convert_alpha()
+        
     def update(self):
         keys = pygame.key.get_pressed()
 
@@ -348,18 +426,25 @@ class Player(pygame.sprite.Sprite):
         return None
 
 class Bullet(pygame.sprite.Sprite):
+    # Spray image shared by every bullet; bullets never modify it
+    _IMAGE = None
+
     def __init__(self, x, y):
         super().__init__()
         self.width = 12
         self.height = 20
-        self.image = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-        self.draw_spray()
+        if Bullet._IMAGE is None:
+            Bullet._IMAGE = self.draw_spray(self.width, self.height).convert_alpha()
+        self.image = Bullet._IMAGE
         self.rect = self.image.get_rect()
         self.rect.centerx = x
         self.rect.bottom = y
         self.speed = 8
         
-    def draw_spray(self):
+    @staticmethod
+    def draw_spray(width, height):
+        image = pygame.Surface((width, height), pygame.SRCALPHA)
+        
         # Enhanced spray particle effect
         for i in range(5):
             y = i * 4
@@ -370,10 +455,12 @@ class Bullet(pygame.sprite.Sprite):
             glow_surf = pygame.Surface((size + 4, size + 4), pygame.SRCALPHA)
             pygame.draw.circle(glow_surf, (*FRESH_GREEN, alpha//2), 
                              ((size + 4)//2, (size + 4)//2), (size + 4)//2)
-            self.image.blit(glow_surf, (6 - (size + 4)//2, y - 2))
+            image.blit(glow_surf, (6 - (size + 4)//2, y - 2))
             
             # Core spray
-            pygame.draw.circle(self.image, (*WHITE, alpha), (6, y + 2), size//2)
+            pygame.draw.circle(image, (*WHITE, alpha), (6, y + 2), size//2)
+            
+        return image
             
     def update(self):
         self.rect.y -= self.speed
@@ -381,14 +468,24 @@ class Bullet(pygame.sprite.Sprite):
             self.kill()
 
 class Odor(pygame.sprite.Sprite):
+    SIZE = 45
+    # Number of distinct odor designs
+    ODOR_TYPES = 4
+    # Number of pre-rendered animation frames per 2*pi cycle
+    ANIMATION_FRAMES = 16
+    # Animation frames shared by all instances, indexed by odor type then frame
+    _FRAMES = None
+
     def __init__(self, x, y, odor_type=0):
         super().__init__()
+        if Odor._FRAMES is None:
+            Odor._build_frame_bank()
         self.odor_type = odor_type
-        self.size = 45
-        self.image = pygame.Surface((self.size, self.size), pygame.SRCALPHA)
-        self.animation_frame = 0
+        self.size = Odor.SIZE
+        # Random start phase so the formation doesn't animate in lockstep
+        self.animation_frame = random.random() * math.pi * 2
         self.animation_speed = 0.1
-        self.wobble = random.random() * math.pi * 2  # FIXED: Move this before draw_odor()
+        self._frame = None
         self.draw_odor()
         self.rect = self.image.get_rect()
         self.rect.x = x
@@ -396,16 +493,35 @@ class Odor(pygame.sprite.Sprite):
         # Remove individual movement - will be controlled by game formation logic
         self.points = (odor_type + 1) * 10
         
+    @classmethod
+    def _build_frame_bank(cls):
+        step = 2 * math.pi / cls.ANIMATION_FRAMES
+        cls._FRAMES = [
+            [cls.render_odor(odor_type, cls.SIZE, i * step, i * step).convert_alpha()
+             for i in range(cls.ANIMATION_FRAMES)]
+            for odor_type in range(cls.ODOR_TYPES)
+        ]
+        
     def draw_odor(self):
-        # Clear the image
-        self.image.fill((0, 0, 0, 0))
+        # Pick the pre-rendered frame for the current animation phase; most
+        # updates land on the same frame and can return early
+        frame = int(self.animation_frame * Odor.ANIMATION_FRAMES / (2 * math.pi)) % Odor.ANIMATION_FRAMES
+        if frame == self._frame:
+            return
+        self._frame = frame
+        self.image = Odor._FRAMES[self.odor_type % Odor.ODOR_TYPES][frame]
+        
+    @staticmethod
+    def render_odor(odor_type, size, wave_phase, face_phase):
+        """Draw one odor animation frame onto a new transparent surface."""
+        image = pygame.Surface((size, size), pygame.SRCALPHA)
         
         # Different odor cloud designs based on type
         colors = [(50, 150, 50), (147, 112, 219), (255, 140, 0), (200, 50, 50)]
-        color = colors[self.odor_type % len(colors)]
+        color = colors[odor_type % len(colors)]
         
         # Animated wavy odor cloud with more detail
-        wave = math.sin(self.animation_frame + self.wobble) * 3
+        wave = math.sin(wave_phase) * 3
         
         # Multiple cloud layers for depth
         cloud_layers = [
@@ -423,67 +539,117 @@ class Odor(pygame.sprite.Sprite):
             
             # Outer glow
             glow_color = (*color, alpha//3)
-            pygame.draw.circle(self.image, glow_color, pos, size + 3)
+            pygame.draw.circle(image, glow_color, pos, size + 3)
             
             # Main cloud
             cloud_color = (*color, alpha)
-            pygame.draw.circle(self.image, cloud_color, pos, size)
+            pygame.draw.circle(image, cloud_color, pos, size)
             
         # Animated face
-        eye_offset = math.sin(self.animation_frame * 2) * 1
+        eye_offset = math.sin(face_phase * 2) * 1
         
         # Eyes
-        pygame.draw.circle(self.image, BLACK, (17, 20 + int(eye_offset)), 3)
-        pygame.draw.circle(self.image, BLACK, (28, 20 + int(eye_offset)), 3)
+        pygame.draw.circle(image, BLACK, (17, 20 + int(eye_offset)), 3)
+        pygame.draw.circle(image, BLACK, (28, 20 + int(eye_offset)), 3)
         
         # Angry eyebrows
-        pygame.draw.line(self.image, BLACK, (14, 16), (19, 18), 2)
-        pygame.draw.line(self.image, BLACK, (26, 18), (31, 16), 2)
+        pygame.draw.line(image, BLACK, (14, 16), (19, 18), 2)
+        pygame.draw.line(image, BLACK, (26, 18), (31, 16), 2)
         
         # Grumpy mouth
-        mouth_wave = math.sin(self.animation_frame * 3) * 1
-        pygame.draw.arc(self.image, BLACK, 
+        mouth_wave = math.sin(face_phase * 3) * 1
+        pygame.draw.arc(image, BLACK, 
                        (15, 24 + int(mouth_wave), 15, 8), 0, math.pi, 2)
         
+        return image
+        
     def update(self):
         # Only handle animation - movement is controlled by game formation logic
         self.animation_frame += self.animation_speed
         self.draw_odor()
-        
-    def move_formation(self, dx, dy):
-        """Move this odor as part of the formation"""
-        self.rect.x += dx
-        self.rect.y += dy
 
-class Particle(pygame.sprite.Sprite):
-    def __init__(self, x, y, color):
-        super().__init__()
-        self.size = random.randint(3, 10)
-        self.image = pygame.Surface((self.size * 2, self.size * 2), pygame.SRCALPHA)
-        
-        # Glowing particle
-        pygame.draw.circle(self.image, (*color, 100), (self.size, self.size), self.size)
-        pygame.draw.circle(self.image, (*color, 255), (self.size, self.size), self.size//2)
-        
-        self.rect = self.image.get_rect(center=(x, y))
-        self.vel_x = random.uniform(-4, 4)
-        self.vel_y = random.uniform(-6, -1)
-        self.gravity = 0.3
-        self.lifetime = 40
-        self.max_lifetime = 40
+class ParticleSystem:
+    """Explosion particles stored as parallel NumPy arrays and updated in one step."""
+    GRAVITY = 0.3
+    LIFETIME = 40
+    # Number of pre-rendered fade levels per particle image
+    ALPHA_STEPS = 8
+
+    def __init__(self):
+        self.rng = np.random.default_rng()
+        # Particle colors seen so far; particles store an index into this list
+        self.colors = []
+        # Faded particle images keyed by (color index, size)
+        self._images = {}
+        self.empty()
+        
+    def empty(self):
+        self.pos = np.empty((0, 2), dtype=np.float32)
+        self.vel = np.empty((0, 2), dtype=np.float32)
+        self.life = np.empty(0, dtype=np.int32)
+        self.size = np.empty(0, dtype=np.int32)
+        self.color = np.empty(0, dtype=np.int32)
+        
+    def __len__(self):
+        return len(self.life)
+        
+    def emit(self, x, y, color, count):
+        if color not in self.colors:
+            self.colors.append(color)
+        
+        vel = np.column_stack([
+            self.rng.uniform(-4, 4, count),
+            self.rng.uniform(-6, -1, count)
+        ])
+        self.pos = np.concatenate([self.pos, np.full((count, 2), (x, y), dtype=np.float32)])
+        self.vel = np.concatenate([self.vel, vel.astype(np.float32)])
+        self.life = np.concatenate([self.life, np.full(count, self.LIFETIME, dtype=np.int32)])
+        self.size = np.concatenate([self.size, self.rng.integers(3, 10, count, endpoint=True, dtype=np.int32)])
+        self.color = np.concatenate([self.color, np.full(count, self.colors.index(color), dtype=np.int32)])
         
     def update(self):
-        self.rect.x += self.vel_x
-        self.rect.y += self.vel_y
-        self.vel_y += self.gravity
-        self.lifetime -= 1
-        
-        # Fade out
-        alpha = int(255 * (self.lifetime / self.max_lifetime))
-        self.image.set_alpha(alpha)
-        
-        if self.lifetime <= 0:
-            self.kill()
+        self.pos += self.vel
+        self.vel[:, 1] += self.GRAVITY
+        self.life -= 1
+        
+        alive = self.life > 0
+        if not alive.all():
+            self.pos = self.pos[alive]
+            self.vel = self.vel[alive]
+            self.life = self.life[alive]
+            self.size = self.size[alive]
+            self.color = self.color[alive]
+            
+    def faded_images(self, color_index, size):
+        """Return the glowing particle image at each fade level, rendering it on first use."""
+        key = (color_index, size)
+        images = self._images.get(key)
+        if images is None:
+            color = self.colors[color_index]
+            image = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+            
+            # Glowing particle
+            pygame.draw.circle(image, (*color, 100), (size, size), size)
+            pygame.draw.circle(image, (*color, 255), (size, size), size//2)
+            
+            images = []
+            for step in range(self.ALPHA_STEPS):
+                faded = image.convert_alpha()
+                faded.set_alpha(int(255 * (step + 1) / self.ALPHA_STEPS))
+                images.append(faded)
+            self._images[key] = images
+        return images
+        
+    def draw_list(self):
+        """Return the (image, position) pairs to blit for every live particle."""
+        # Fade out by picking the image for the particle's remaining life
+        fade = (self.life - 1) * self.ALPHA_STEPS // self.LIFETIME
+        corner = (self.pos - self.size[:, None]).astype(np.int32)
+        return [
+            (self.faded_images(c, s)[f], (x, y))
+            for (x, y), s, c, f in zip(corner.tolist(), self.size.tolist(),
+                                       self.color.tolist(), fade.tolist())
+        ]
 
 class Game:
     def set_fullscreen(self):
@@ -491,9 +657,15 @@ class Game:
         global SCREEN_WIDTH, SCREEN_HEIGHT
         info = pygame.display.Info()
         SCREEN_WIDTH, SCREEN_HEIGHT = info.current_w, info.current_h
+        # Already at the native size, so no SCALED: a scaled display presents
+        # the whole frame on every update and would defeat dirty rect updates
         self.screen = pygame.display.set_mode(
             (SCREEN_WIDTH, SCREEN_HEIGHT), pygame.FULLSCREEN
         )
+        # A new display needs a full flip before dirty rect updates and a
+        # menu composed at the new size
+        self._presented_state = None
+        self.menu_background = None
 
     def set_portrait_fullscreen(self):
         """Initialize a portrait oriented full-screen window."""
@@ -504,15 +676,26 @@ class Game:
             SCREEN_WIDTH, SCREEN_HEIGHT = h, w
         else:
             SCREEN_WIDTH, SCREEN_HEIGHT = w, h
+        # SCALED letterboxes the portrait surface on a landscape display; it
+        # presents the full frame even for dirty rect updates
         self.screen = pygame.display.set_mode(
-            (SCREEN_WIDTH, SCREEN_HEIGHT), pygame.FULLSCREEN
+            (SCREEN_WIDTH, SCREEN_HEIGHT), pygame.FULLSCREEN | pygame.SCALED,
+            vsync=VSYNC
         )
+        # A new display needs a full flip before dirty rect updates and a
+        # menu composed at the new size
+        self._presented_state = None
+        self.menu_background = None
 
     def __init__(self):
         self.set_fullscreen()
         pygame.display.set_caption(
             "Dove Fresh Invaders - Defeat the Bad Odors!"
         )
+        # Only queue the events the game handles; keyboard and joystick
+        # state queried directly is unaffected
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN, pygame.JOYBUTTONDOWN])
         self.clock = pygame.time.Clock()
         self.joystick = None
         self.running = True
@@ -520,6 +703,28 @@ class Game:
         self.small_font = pygame.font.Font(None, 24)
         # Large font for prominently displayed score
         self.big_font = pygame.font.Font(None, 72)
+        # Rendered text surfaces keyed by (font, text, color)
+        self._text_cache = {}
+        # Last (values, color, surface) drawn for each HUD slot
+        self._value_memo = {}
+        
+        # State shown by the last full flip and the regions updated since,
+        # for presenting only dirty rects on mostly static screens
+        self._presented_state = None
+        self._last_dirty = []
+        
+        # "GAME OVER" pre-rendered at each step of its pulsing red color
+        self.game_over_surfs = []
+        for i in range(64):
+            pulse = abs(math.sin(i / 64 * math.pi)) * 0.3 + 0.7
+            self.game_over_surfs.append(
+                self.font.render("GAME OVER", True, (int(255 * pulse), 0, 0)).convert_alpha())
+        
+        # Deodorant icon and the lives bar for every possible lives count
+        self.life_icon = pygame.Surface((15, 20)).convert()
+        self.life_icon.fill(GRAY)
+        pygame.draw.rect(self.life_icon, DOVE_BLUE, (2, 3, 11, 14))
+        self.lives_bars = [self.render_lives_bar(lives) for lives in range(MAX_LIVES + 1)]
 
         # Button calibration
         self.button_map = {}
@@ -533,39 +738,64 @@ class Game:
         # Initialize sound effects
         if SOUND_ENABLED:
             self.sound_fx = SoundEffects()
-            self.spray_sound = self.sound_fx.generate_spray_sound()
-            self.explosion_sound = self.sound_fx.generate_explosion_sound()
-            self.bad_odor_sound = self.sound_fx.generate_bad_odor_sound()
+            # Every effect is synthesized up front so nothing is built mid-game
+            self.sfx = {
+                "spray": self.sound_fx.load_cached(
+                    "spray", self.sound_fx.generate_spray_sound),
+                "explosion": self.sound_fx.load_cached(
+                    "explosion", self.sound_fx.generate_explosion_sound),
+                "bad_odor": self.sound_fx.load_cached(
+                    "bad_odor", self.sound_fx.generate_bad_odor_sound),
+                "game_over": self.sound_fx.load_cached(
+                    "game_over", self.sound_fx.generate_game_over_sound)
+            }
             self.level_complete_sounds = self.sound_fx.generate_level_complete_sound()
-            self.game_over_sound = self.sound_fx.generate_game_over_sound()
+            
+            # Reserve channel 0 for music so effects never take it over
+            pygame.mixer.set_reserved(1)
             
             # Background music
-            self.background_music = self.sound_fx.generate_background_music()
+            self.background_music = self.sound_fx.load_cached(
+                "background_music", self.sound_fx.generate_background_music)
             self.music_channel = pygame.mixer.Channel(0)
             self.music_volume = 0.3
             
             # Start music immediately on menu screen
             self.music_channel.play(self.background_music, loops=-1)
             self.music_channel.set_volume(self.music_volume)
+            self.music_on = True
         else:
             self.sound_enabled = False
+            self.music_on = False
         
         # Game state will be determined after joystick setup
         self.state = "MENU"
+        # Per-state screen and key handlers, looked up once per frame or key press
+        self._draw_dispatch = {
+            "MENU": self.draw_menu,
+            "PLAYING": self.draw_game,
+            "GAME_OVER": self.draw_game_over,
+            "CALIBRATE": self.draw_calibration
+        }
+        self._key_dispatch = {
+            "MENU": self._handle_menu_key,
+            "PLAYING": self._handle_playing_key,
+            "GAME_OVER": self._handle_game_over_key,
+            "CALIBRATE": self._handle_calibrate_key
+        }
         self.score = 0
         self.level = 1
-        self.lives = 3
+        self.lives = MAX_LIVES
         self.high_scores = self.load_high_scores()
         self.combo = 0
         self.combo_timer = 0
         self.level_score = 0
         self.points_per_odor = 0
         
-        # Sprite groups
-        self.all_sprites = pygame.sprite.Group()
+        # Sprite groups, updated and drawn layer by layer
         self.odors = pygame.sprite.Group()
         self.bullets = pygame.sprite.Group()
-        self.particles = pygame.sprite.Group()
+        self.particles = ParticleSystem()
         
         # Player
         self.player = None
@@ -575,16 +805,26 @@ class Game:
         self.odor_speed = 1
         self.odor_move_timer = 0
         self.odor_move_delay = 30  # Move every 30 frames initially
-        
-        # Background stars
-        self.stars = []
-        for _ in range(100):
-            self.stars.append({
-                'x': random.randint(BORDER_WIDTH, SCREEN_WIDTH - BORDER_WIDTH),
-                'y': random.randint(BORDER_WIDTH, SCREEN_HEIGHT - BORDER_WIDTH),
-                'speed': random.uniform(0.5, 2),
-                'size': random.randint(1, 3)
-            })
+        self.odor_formation = []
+        self.odor_positions = np.empty((0, 2), dtype=np.int32)
+        
+        # Background stars - one record per star
+        self.rng = np.random.default_rng()
+        self.stars = np.zeros(STAR_COUNT, dtype=STAR_DTYPE)
+        self.stars['x'] = self.rng.integers(
+            BORDER_WIDTH, SCREEN_WIDTH - BORDER_WIDTH, STAR_COUNT, endpoint=True)
+        self.stars['y'] = self.rng.integers(
+            BORDER_WIDTH, SCREEN_HEIGHT - BORDER_WIDTH, STAR_COUNT, endpoint=True)
+        self.stars['size'] = self.rng.integers(1, 3, STAR_COUNT, endpoint=True)
+        self.stars['speed'] = self.rng.uniform(0.5, 2, STAR_COUNT)
+        # Pre-rendered star images by size: grey shades in game, white elsewhere
+        star_surfs = {size: self.make_star_surf(size, (size * 80,) * 3) for size in range(1, 4)}
+        star_surfs_white = {size: self.make_star_surf(size, WHITE) for size in range(1, 4)}
+        # A star keeps its size for life, so resolve its image and extent once
+        sizes = self.stars['size'].tolist()
+        self._star_surfs = [star_surfs[size] for size in sizes]
+        self._star_surfs_white = [star_surfs_white[size] for size in sizes]
+        self.star_diameters = [size * 2 for size in sizes]
         pygame.joystick.init()
         if pygame.joystick.get_count() > 0:
             self.joystick = pygame.joystick.Joystick(0)
@@ -647,6 +887,8 @@ class Game:
         self.high_scores.sort(reverse=True)
         self.high_scores = self.high_scores[:10]
         self.save_high_scores()
+        # The menu lists the high scores, so recompose it
+        self.menu_background = None
         
     def create_odor_wave(self):
         # Progressive difficulty: more enemies and faster movement
@@ -671,8 +913,7 @@ class Game:
         self.odor_move_delay = max(10, 30 - (self.level - 1) * 2)
         
         # Play bad odor sound when wave appears
-        if SOUND_ENABLED:
-            self.bad_odor_sound.play()
+        self.play_sfx("bad_odor")
         
         for row in range(rows):
             for col in range(cols):
@@ -682,19 +923,35 @@ class Game:
                 odor = Odor(x, y, odor_type)
                 odor.points = self.points_per_odor
                 self.odors.add(odor)
-                self.all_sprites.add(odor)
+        
+        # Formation positions kept as an array for vectorized edge checks and movement
+        self.odor_formation = list(self.odors)
+        self.odor_positions = np.array(
+            [odor.rect.topleft for odor in self.odor_formation], dtype=np.int32
+        ).reshape(-1, 2)
+        
+    def sync_odor_formation(self):
+        """Drop destroyed odors from the formation position array."""
+        if len(self.odor_formation) == len(self.odors):
+            return
+        alive = np.array([odor.alive() for odor in self.odor_formation], dtype=bool)
+        self.odor_formation = [odor for odor in self.odor_formation if odor.alive()]
+        self.odor_positions = self.odor_positions[alive]
+        
+    def move_odor_formation(self, dx, dy):
+        """Translate the whole formation and write the positions back to the sprites."""
+        self.odor_positions += (dx, dy)
+        for odor, pos in zip(self.odor_formation, self.odor_positions.tolist()):
+            odor.rect.topleft = pos
                 
     def create_explosion(self, x, y, color):
-        for _ in range(15):
-            particle = Particle(x, y, color)
-            self.particles.add(particle)
-            self.all_sprites.add(particle)
+        self.particles.emit(x, y, color, 15)
             
     def start_game(self):
         self.state = "PLAYING"
         self.score = 0
         self.level = 1
-        self.lives = 3
+        self.lives = MAX_LIVES
         self.combo = 0
         self.combo_timer = 0
         self.level_score = 0
@@ -706,8 +963,10 @@ class Game:
         self.odor_move_timer = 0
         self.odor_move_delay = 30
         
+        # Drop text rendered for the previous game
+        self._text_cache.clear()
+        
         # Clear all sprites
-        self.all_sprites.empty()
         self.odors.empty()
         self.bullets.empty()
         self.particles.empty()
@@ -720,19 +979,24 @@ class Game:
             joystick_center=self.joystick_center,
             button_map=self.button_map,
         )
-        self.all_sprites.add(self.player)
         
         # Create first wave
         self.create_odor_wave()
         
-        # Music is already playing from menu, just ensure it's at the right volume
-        if SOUND_ENABLED and self.music_channel.get_volume() == 0:
+        # Music normally keeps playing from the menu; restart it if the last
+        # game over faded it out
+        if SOUND_ENABLED and not self.music_on:
+            self.music_channel.play(self.background_music, loops=-1)
             self.music_channel.set_volume(self.music_volume)
+            self.music_on = True
         
     def update(self):
         if self.state == "PLAYING":
             # Update all sprites
-            self.all_sprites.update()
+            self.player.update()
+            self.odors.update()
+            self.bullets.update()
+            self.particles.update()
             
             # Update combo timer
             if self.combo_timer > 0:
@@ -741,11 +1005,7 @@ class Game:
                 self.combo = 0
             
             # Update background stars
-            for star in self.stars:
-                star['y'] += star['speed']
-                if star['y'] > SCREEN_HEIGHT - BORDER_WIDTH:
-                    star['y'] = BORDER_WIDTH
-                    star['x'] = random.randint(BORDER_WIDTH, SCREEN_WIDTH - BORDER_WIDTH)
+            self.update_stars()
             
             # Player shooting
             keys = pygame.key.get_pressed()
@@ -756,28 +1016,23 @@ class Game:
                 bullet = self.player.shoot()
                 if bullet:
                     self.bullets.add(bullet)
-                    self.all_sprites.add(bullet)
-                    if SOUND_ENABLED:
-                        self.spray_sound.play()
+                    self.play_sfx("spray")
                     
             # Check collisions
-            for bullet in self.bullets:
-                hit_odors = pygame.sprite.spritecollide(bullet, self.odors, True)
-                if hit_odors:
-                    bullet.kill()
-                    for odor in hit_odors:
-                        # Combo system
-                        self.combo += 1
-                        self.combo_timer = 60
+            hits = pygame.sprite.groupcollide(self.bullets, self.odors, True, True)
+            for hit_odors in hits.values():
+                for odor in hit_odors:
+                    # Combo system
+                    self.combo += 1
+                    self.combo_timer = 60
 
-                        # Score based on level targets
-                        score_gained = self.points_per_odor
-                        self.score += score_gained
-                        self.level_score += score_gained
-                        
-                        self.create_explosion(odor.rect.centerx, odor.rect.centery, FRESH_GREEN)
-                        if SOUND_ENABLED:
-                            self.explosion_sound.play()
+                    # Score based on level targets
+                    score_gained = self.points_per_odor
+                    self.score += score_gained
+                    self.level_score += score_gained
+                    
+                    self.create_explosion(odor.rect.centerx, odor.rect.centery, FRESH_GREEN)
+                    self.play_sfx("explosion")
                         
             # Check if odors hit player
             hit_player = pygame.sprite.spritecollide(self.player, self.odors, True)
@@ -785,8 +1040,7 @@ class Game:
                 self.lives -= 1
                 self.combo = 0
                 self.create_explosion(self.player.rect.centerx, self.player.rect.centery, RED)
-                if SOUND_ENABLED:
-                    self.explosion_sound.play()
+                self.play_sfx("explosion")
                 
                 if self.lives <= 0:
                     self.game_over()
@@ -795,21 +1049,20 @@ class Game:
             self.odor_move_timer += 1
             if self.odor_move_timer >= self.odor_move_delay:
                 self.odor_move_timer = 0
+                self.sync_odor_formation()
                 
                 # Check if formation should change direction
                 hit_edge = False
-                for odor in self.odors:
-                    if (self.odor_direction > 0 and odor.rect.right >= SCREEN_WIDTH - BORDER_WIDTH) or \
-                       (self.odor_direction < 0 and odor.rect.left <= BORDER_WIDTH):
-                        hit_edge = True
-                        break
+                if len(self.odor_positions):
+                    xs = self.odor_positions[:, 0]
+                    hit_edge = (self.odor_direction > 0 and xs.max() + Odor.SIZE >= SCREEN_WIDTH - BORDER_WIDTH) or \
+                               (self.odor_direction < 0 and xs.min() <= BORDER_WIDTH)
                 
                 if hit_edge:
                     # Change direction and drop down
                     self.odor_direction *= -1
                     # Move all odors down
-                    for odor in self.odors:
-                        odor.move_formation(0, 30)
+                    self.move_odor_formation(0, 30)
                     # Increase speed slightly after each direction change
                     self.odor_speed += 0.1
                     if self.odor_move_delay > 5:
@@ -817,14 +1070,13 @@ class Game:
                 else:
                     # Move formation horizontally
                     move_distance = int(self.odor_direction * self.odor_speed * 8)
-                    for odor in self.odors:
-                        odor.move_formation(move_distance, 0)
+                    self.move_odor_formation(move_distance, 0)
                     
             # Check if odors reached bottom
-            for odor in self.odors:
-                if odor.rect.bottom >= self.player.rect.top:
-                    self.game_over()
-                    break
+            self.sync_odor_formation()
+            if len(self.odor_positions) and \
+               self.odor_positions[:, 1].max() + Odor.SIZE >= self.player.rect.top:
+                self.game_over()
                     
             # Next level when all odors destroyed
             if len(self.odors) == 0:
@@ -855,54 +1107,115 @@ class Game:
                 self.calibration_max = val
 
         # Update background stars for all screens
-        for star in self.stars:
-            star['y'] += star['speed']
-            if star['y'] > SCREEN_HEIGHT - BORDER_WIDTH:
-                star['y'] = BORDER_WIDTH
-                star['x'] = random.randint(BORDER_WIDTH, SCREEN_WIDTH - BORDER_WIDTH)
+        self.update_stars()
+                
+    def update_stars(self):
+        stars = self.stars
+        stars['y'] += stars['speed']
+        wrapped = stars['y'] > SCREEN_HEIGHT - BORDER_WIDTH
+        stars['y'][wrapped] = BORDER_WIDTH
+        stars['x'][wrapped] = self.rng.integers(
+            BORDER_WIDTH, SCREEN_WIDTH - BORDER_WIDTH, wrapped.sum(), endpoint=True)
+                
+    @staticmethod
+    def make_star_surf(size, color):
+        """Render a star of the given radius on a black color-keyed surface."""
+        surf = pygame.Surface((size * 2, size * 2)).convert()
+        surf.set_colorkey(BLACK)
+        pygame.draw.circle(surf, color, (size, size), size)
+        return surf
+        
+    def draw_stars(self, star_surfs, want_rects=False):
+        """Draw the star field with one image per star, returning the rects it covered if want_rects."""
+        stars = self.stars
+        left = (stars['x'].astype(np.int32) - stars['size']).tolist()
+        top = (stars['y'].astype(np.int32) - stars['size']).tolist()
+        self.blit_batch(list(zip(star_surfs, zip(left, top))))
+        if not want_rects:
+            return None
+        return [
+            pygame.Rect(x, y, diameter, diameter)
+            for x, y, diameter in zip(left, top, self.star_diameters)
+        ]
                 
     def game_over(self):
         self.state = "GAME_OVER"
         self.add_high_score(self.score)
         if SOUND_ENABLED:
-            self.game_over_sound.play()
+            self.play_sfx("game_over")
             # Fade out music
             self.music_channel.fadeout(1000)
+            self.music_on = False
         
-    def draw_menu(self):
-        self.screen.fill(DOVE_BLUE)
-        
-        # Animated background
-        for star in self.stars:
-            pygame.draw.circle(self.screen, WHITE, 
-                             (int(star['x']), int(star['y'])), star['size'])
+    def play_sfx(self, name):
+        """Play a sound effect on any free unreserved channel."""
+        if SOUND_ENABLED:
+            self.sfx[name].play()
+        
+    def render_lives_bar(self, lives):
+        """Compose a row of life icons, 25 pixels apart, on a transparent surface."""
+        bar = pygame.Surface((MAX_LIVES * 25, 20), pygame.SRCALPHA)
+        for i in range(lives):
+            bar.blit(self.life_icon, (i * 25, 0))
+        return bar.convert_alpha()
+        
+    def blit_batch(self, draws):
+        """Blit a list of (surface, dest) pairs onto the screen in one call."""
+        if HAS_FBLITS:
+            self.screen.fblits(draws)
+        else:
+            self.screen.blits(draws, doreturn=False)
+        
+    def render_cached(self, font, text, color):
+        """Render antialiased text, reusing the surface while the same string is drawn."""
+        key = (id(font), text, color)
+        surface = self._text_cache.get(key)
+        if surface is None:
+            if len(self._text_cache) >= TEXT_CACHE_SIZE:
+                self._text_cache.clear()
+            surface = font.render(text, True, color).convert_alpha()
+            self._text_cache[key] = surface
+        return surface
+        
+    def render_value(self, slot, values, font, template, color):
+        """Render template.format(*values), formatting only when the values change."""
+        memo = self._value_memo.get(slot)
+        if memo is None or memo[0] != values or memo[1] != color:
+            memo = (values, color, self.render_cached(font, template.format(*values), color))
+            self._value_memo[slot] = memo
+        return memo[2]
+        
+    def render_menu_background(self):
+        """Compose the static menu screen: background color, title, high scores and instructions."""
+        background = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+        background.fill(DOVE_BLUE)
         
         # Title with shadow
         shadow = self.font.render("DOVE FRESH INVADERS", True, BLACK)
         shadow_rect = shadow.get_rect(center=(SCREEN_WIDTH//2 + 2, 102))
-        self.screen.blit(shadow, shadow_rect)
+        background.blit(shadow, shadow_rect)
         
         title = self.font.render("DOVE FRESH INVADERS", True, WHITE)
         title_rect = title.get_rect(center=(SCREEN_WIDTH//2, 100))
-        self.screen.blit(title, title_rect)
+        background.blit(title, title_rect)
         
         # Subtitle
         subtitle = self.small_font.render("Defeat the Bad Odors!", True, FRESH_GREEN)
         subtitle_rect = subtitle.get_rect(center=(SCREEN_WIDTH//2, 140))
-        self.screen.blit(subtitle, subtitle_rect)
+        background.blit(subtitle, subtitle_rect)
         
         # High scores positioned away from the quit instruction
         y = 220
         high_score_title = self.small_font.render("HIGH SCORES", True, YELLOW)
         high_score_rect = high_score_title.get_rect(center=(SCREEN_WIDTH//2, y))
-        self.screen.blit(high_score_title, high_score_rect)
+        background.blit(high_score_title, high_score_rect)
 
         y += 30
         for i, score in enumerate(self.high_scores[:5]):
             score_text = self.small_font.render(
                 f"{i+1}. {math.ceil(score):,}", True, WHITE)
             score_rect = score_text.get_rect(center=(SCREEN_WIDTH//2, y))
-            self.screen.blit(score_text, score_rect)
+            background.blit(score_text, score_rect)
             y += 25
 
         # Instructions below the high scores
@@ -918,63 +1231,80 @@ class Game:
         for instruction in instructions:
             text = self.small_font.render(instruction, True, WHITE)
             text_rect = text.get_rect(center=(SCREEN_WIDTH//2, y))
-            self.screen.blit(text, text_rect)
+            background.blit(text, text_rect)
             y += 30
             
+        return background
+        
+    def draw_menu(self):
+        # Static layout is composed once and rebuilt when the high scores change
+        if self.menu_background is None:
+            self.menu_background = self.render_menu_background()
+        self.screen.blit(self.menu_background, (0, 0))
+        
+        # Animated background
+        dirty = self.draw_stars(self._star_surfs_white, want_rects=True)
+            
         # Music indicator removed
+        
+        # Only the stars move on the menu
+        return dirty
             
     def draw_game(self):
         self.screen.fill(BLACK)
         
         # Draw animated background stars
-        for star in self.stars:
-            color = (star['size'] * 80, star['size'] * 80, star['size'] * 80)
-            pygame.draw.circle(self.screen, color, 
-                             (int(star['x']), int(star['y'])), star['size'])
+        self.draw_stars(self._star_surfs)
         
-        # Draw sprites
-        self.all_sprites.draw(self.screen)
+        # Draw sprites and particles in one batch, bypassing Group.draw's
+        # per-sprite rect bookkeeping
+        sprite_draws = [(self.player.image, self.player.rect)]
+        sprite_draws += [(odor.image, odor.rect) for odor in self.odors]
+        sprite_draws += [(bullet.image, bullet.rect) for bullet in self.bullets]
+        sprite_draws += self.particles.draw_list()
+        self.blit_batch(sprite_draws)
         
-        # Draw UI with better styling
+        # Draw UI with better styling, collected and blitted in one batch
         # Score prominently centered on screen
-        score_text = self.big_font.render(
-            f"Score: {math.ceil(self.score):,}", True, WHITE)
+        score_text = self.render_value("score", (math.ceil(self.score),), self.big_font,
+            "Score: {:,}", WHITE)
         score_rect = score_text.get_rect(center=(SCREEN_WIDTH // 2,
                                                 SCREEN_HEIGHT // 2))
-        self.screen.blit(score_text, score_rect)
+        ui_draws = [(score_text, score_rect)]
 
         # Level progress score
-        level_score_text = self.small_font.render(
-            f"Level Score: {math.ceil(self.level_score):,}/5000", True, WHITE)
-        self.screen.blit(level_score_text, (BORDER_WIDTH, BORDER_WIDTH))
+        level_score_text = self.render_value("level_score", (math.ceil(self.level_score),), self.small_font,
+            "Level Score: {:,}/5000", WHITE)
+        ui_draws.append((level_score_text, (BORDER_WIDTH, BORDER_WIDTH)))
         
         # Combo indicator
         if self.combo > 1:
             combo_color = YELLOW if self.combo < 5 else ORANGE
-            combo_text = self.small_font.render(f"COMBO x{self.combo}!", True, combo_color)
-            self.screen.blit(combo_text, (BORDER_WIDTH, 70))
+            combo_text = self.render_value("combo", (self.combo,), self.small_font, "COMBO x{}!", combo_color)
+            ui_draws.append((combo_text, (BORDER_WIDTH, 70)))
         
         # Level
-        level_text = self.font.render(f"Level: {self.level}", True, WHITE)
+        level_text = self.render_value("level", (self.level,), self.font, "Level: {}", WHITE)
         level_rect = level_text.get_rect(center=(SCREEN_WIDTH//2, 25))
-        self.screen.blit(level_text, level_rect)
+        ui_draws.append((level_text, level_rect))
         
         # Difficulty indicator
-        difficulty_text = self.small_font.render(f"Speed: {self.odor_speed:.1f} | Delay: {self.odor_move_delay}", True, YELLOW)
+        difficulty_text = self.render_value("difficulty", (self.odor_speed, self.odor_move_delay), self.small_font,
+            "Speed: {:.1f} | Delay: {}", YELLOW)
         difficulty_rect = difficulty_text.get_rect(center=(SCREEN_WIDTH//2, 50))
-        self.screen.blit(difficulty_text, difficulty_rect)
+        ui_draws.append((difficulty_text, difficulty_rect))
         
         # Lives
-        lives_text = self.font.render(f"Lives: ", True, WHITE)
-        self.screen.blit(lives_text, (SCREEN_WIDTH - 200, BORDER_WIDTH))
-        
-        # Draw deodorant icons for lives
-        for i in range(self.lives):
-            x = SCREEN_WIDTH - 100 + i * 25
-            pygame.draw.rect(self.screen, GRAY, (x, BORDER_WIDTH - 5, 15, 20))
-            pygame.draw.rect(self.screen, DOVE_BLUE, (x + 2, BORDER_WIDTH - 2, 11, 14))
+        lives_text = self.render_cached(self.font, f"Lives: ", WHITE)
+        ui_draws.append((lives_text, (SCREEN_WIDTH - 200, BORDER_WIDTH)))
+        
+        # Deodorant icons for lives
+        lives_bar = self.lives_bars[max(0, min(self.lives, MAX_LIVES))]
+        ui_draws.append((lives_bar, (SCREEN_WIDTH - 100, BORDER_WIDTH - 5)))
             
         # Music indicator removed
+        
+        self.blit_batch(ui_draws)
 
         # Grey frame around the game
         pygame.draw.rect(self.screen, GRAY, self.screen.get_rect(), BORDER_WIDTH)
@@ -983,38 +1313,39 @@ class Game:
         self.screen.fill(BLACK)
         
         # Animated background
-        for star in self.stars:
-            pygame.draw.circle(self.screen, WHITE, 
-                             (int(star['x']), int(star['y'])), star['size'])
-        
-        # Game over text with pulsing effect
-        pulse = abs(math.sin(pygame.time.get_ticks() * 0.002)) * 0.3 + 0.7
-        game_over_color = (int(255 * pulse), 0, 0)
+        dirty = self.draw_stars(self._star_surfs_white, want_rects=True)
         
-        game_over_text = self.font.render("GAME OVER", True, game_over_color)
+        # Game over text with pulsing effect; one pulse lasts pi / 0.002 ms
+        phase = pygame.time.get_ticks() * 0.002 / math.pi
+        steps = len(self.game_over_surfs)
+        game_over_text = self.game_over_surfs[int(phase * steps) % steps]
         game_over_rect = game_over_text.get_rect(center=(SCREEN_WIDTH//2, 200))
         self.screen.blit(game_over_text, game_over_rect)
         
         # Final score
-        score_text = self.font.render(
-            f"Final Score: {math.ceil(self.score):,}", True, WHITE)
+        score_text = self.render_cached(self.font,
+            f"Final Score: {math.ceil(self.score):,}", WHITE)
         score_rect = score_text.get_rect(center=(SCREEN_WIDTH//2, 250))
         self.screen.blit(score_text, score_rect)
         
         # Check if new high score
         if self.high_scores and self.score >= self.high_scores[0]:
-            high_score_text = self.font.render("NEW HIGH SCORE!", True, YELLOW)
+            high_score_text = self.render_cached(self.font, "NEW HIGH SCORE!", YELLOW)
             high_score_rect = high_score_text.get_rect(center=(SCREEN_WIDTH//2, 300))
             self.screen.blit(high_score_text, high_score_rect)
         
         # Instructions
-        restart_text = self.small_font.render("Press ENTER to play again", True, WHITE)
+        restart_text = self.render_cached(self.small_font, "Press ENTER to play again", WHITE)
         restart_rect = restart_text.get_rect(center=(SCREEN_WIDTH//2, 380))
         self.screen.blit(restart_text, restart_rect)
         
-        menu_text = self.small_font.render("Press ESC for main menu", True, WHITE)
+        menu_text = self.render_cached(self.small_font, "Press ESC for main menu", WHITE)
         menu_rect = menu_text.get_rect(center=(SCREEN_WIDTH//2, 410))
         self.screen.blit(menu_text, menu_rect)
+        
+        # Stars and the pulsing title are the only moving parts
+        dirty.append(game_over_rect)
+        return dirty
 
     def draw_calibration(self):
         self.screen.fill(BLACK)
@@ -1045,25 +1376,58 @@ class Game:
             self.screen.blit(instr, instr.get_rect(center=(SCREEN_WIDTH//2, 230)))
 
     def draw_score_overlay(self):
-        score_text = self.small_font.render(
-            f"Score: {math.ceil(self.score):,}", True, WHITE)
+        score_text = self.render_value("overlay_score", (math.ceil(self.score),), self.small_font,
+            "Score: {:,}", WHITE)
         score_rect = score_text.get_rect(topright=(SCREEN_WIDTH - BORDER_WIDTH, BORDER_WIDTH))
         self.screen.blit(score_text, score_rect)
+        return score_rect
         
     def draw(self):
-        if self.state == "MENU":
-            self.draw_menu()
-        elif self.state == "PLAYING":
-            self.draw_game()
-        elif self.state == "GAME_OVER":
-            self.draw_game_over()
-        elif self.state == "CALIBRATE":
-            self.draw_calibration()
+        # Screens that return dirty rects only present those regions; the
+        # rest return None to redraw and flip the whole frame
+        dirty = self._draw_dispatch[self.state]()
 
         if self.state != "PLAYING":
-            self.draw_score_overlay()
+            score_rect = self.draw_score_overlay()
+            if dirty is not None:
+                dirty.append(score_rect)
 
-        pygame.display.flip()
+        if dirty is None or self.state != self._presented_state:
+            pygame.display.flip()
+        else:
+            # Include last frame's rects so stars are erased where they were
+            pygame.display.update(self._last_dirty + dirty)
+        self._presented_state = self.state
+        self._last_dirty = dirty or []
+        
+    def _handle_menu_key(self, key):
+        if key == pygame.K_RETURN:
+            self.start_game()
+        elif key == pygame.K_ESCAPE:
+            self.running = False
+        elif key == pygame.K_j:
+            self.calibration_min = 0.0
+            self.calibration_max = 0.0
+            self.state = "CALIBRATE"
+            
+    def _handle_game_over_key(self, key):
+        if key == pygame.K_RETURN:
+            self.start_game()
+        elif key == pygame.K_ESCAPE:
+            self.state = "MENU"
+            
+    def _handle_playing_key(self, key):
+        if key == pygame.K_ESCAPE:
+            self.state = "MENU"
+            
+    def _handle_calibrate_key(self, key):
+        if key == pygame.K_RETURN:
+            if self.joystick:
+                self.joystick_center = (self.calibration_min + self.calibration_max) / 2
+            self.calibrate_buttons()
+            self.state = "MENU"
+        elif key == pygame.K_ESCAPE:
+            self.state = "MENU"
         
     def handle_events(self):
         for event in pygame.event.get():
@@ -1071,35 +1435,7 @@ class Game:
                 self.running = False
                 
             if event.type == pygame.KEYDOWN:
-                        
-                if self.state == "MENU":
-                    if event.key == pygame.K_RETURN:
-                        self.start_game()
-                    elif event.key == pygame.K_ESCAPE:
-                        self.running = False
-                    elif event.key == pygame.K_j:
-                        self.calibration_min = 0.0
-                        self.calibration_max = 0.0
-                        self.state = "CALIBRATE"
-
-                elif self.state == "GAME_OVER":
-                    if event.key == pygame.K_RETURN:
-                        self.start_game()
-                    elif event.key == pygame.K_ESCAPE:
-                        self.state = "MENU"
-
-                elif self.state == "PLAYING":
-                    if event.key == pygame.K_ESCAPE:
-                        self.state = "MENU"
-
-                elif self.state == "CALIBRATE":
-                    if event.key == pygame.K_RETURN:
-                        if self.joystick:
-                            self.joystick_center = (self.calibration_min + self.calibration_max) / 2
-                        self.calibrate_buttons()
-                        self.state = "MENU"
-                    elif event.key == pygame.K_ESCAPE:
-                        self.state = "MENU"
+                self._key_dispatch[self.state](event.key)
 
             if event.type == pygame.JOYBUTTONDOWN:
                 if self.state == "CALIBRATE":